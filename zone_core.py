@@ -0,0 +1,182 @@
+import math
+import streamlit as st
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the numeric core runs as plain Python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+SHUTTER_SPEEDS = (
+    30, 15, 8, 4, 2, 1,
+    1/2, 1/4, 1/8, 1/15, 1/30, 1/60, 1/125,
+    1/250, 1/500, 1/1000, 1/2000, 1/4000
+)
+
+def _format_shutter(shutter_speed):
+    if shutter_speed >= 1:
+        return f"{shutter_speed:.0f}s"
+    else:
+        return f"1/{round(1/shutter_speed):.0f}s"
+
+# Lookup tables for the fixed slider stops (avoids log2 + formatting per render)
+_EV_TABLE = {s: -math.log2(s) for s in SHUTTER_SPEEDS}
+_LABEL_LONG = {s: f"{s:.0f}s" for s in SHUTTER_SPEEDS if s >= 1}
+_LABEL_SHORT = {s: f"1/{round(1/s):.0f}s" for s in SHUTTER_SPEEDS if s < 1}
+_LABEL_TABLE = {**_LABEL_LONG, **_LABEL_SHORT}
+
+# Bound lookup used as the select_slider format_func over SHUTTER_SPEEDS
+stop_label = _LABEL_TABLE.__getitem__
+
+# Reciprocal of the f/16 ISO 100 reference (16 * 16 * 100)
+_INV_REF = 1.0 / (16 * 16 * 100)
+
+# Which reading _exposure_core based the suggested EV on
+_MODE_SHADOWS = 0
+_MODE_SUBJECT = 1
+_MODE_MIDTONE = 2
+_MODE_FALLBACK = 3
+
+# --- Core Functions ---
+def shutter_to_ev(shutter_speed):
+    if not isinstance(shutter_speed, (int, float)) or shutter_speed <= 0:
+        return None
+    ev = _EV_TABLE.get(shutter_speed)
+    if ev is not None:
+        return ev
+    return -math.log2(shutter_speed)
+
+def ev_to_shutter(ev):
+    return math.exp2(-ev)
+
+def shutter_label(shutter_speed):
+    label = _LABEL_TABLE.get(shutter_speed)
+    if label is None:
+        label = _format_shutter(shutter_speed)
+    return label
+
+def ev_label(ev):
+    return _format_shutter(ev_to_shutter(ev))
+
+@njit(cache=True)
+def _exposure_core(b, d, m, s, aperture, iso):
+    # Missing readings are passed as NaN so the JIT sees only floats
+    if not math.isnan(d):
+        mode = _MODE_SHADOWS
+        suggested_ev = d + 2
+    elif not math.isnan(s):
+        mode = _MODE_SUBJECT
+        suggested_ev = s
+    elif not math.isnan(m):
+        mode = _MODE_MIDTONE
+        suggested_ev = m
+    else:
+        # Only the brightest reading is left
+        mode = _MODE_FALLBACK
+        suggested_ev = b
+
+    # Adjust EV for aperture and ISO (reference EV is f/16 ISO 100)
+    adjusted_ev = suggested_ev - math.log2(aperture * aperture * iso * _INV_REF)
+    return mode, suggested_ev, adjusted_ev
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def recommend_exposure(aperture, iso, brightest=None, darkest=None, midtone=None, subject=None):
+    b = shutter_to_ev(brightest) if brightest else None
+    d = shutter_to_ev(darkest) if darkest else None
+    m = shutter_to_ev(midtone) if midtone else None
+    s = shutter_to_ev(subject) if subject else None
+    if b is None and d is None and m is None and s is None:
+        return "No valid readings provided."
+
+    nan = math.nan
+    mode, suggested_ev, adjusted_ev = _exposure_core(
+        nan if b is None else b,
+        nan if d is None else d,
+        nan if m is None else m,
+        nan if s is None else s,
+        float(aperture),
+        float(iso),
+    )
+
+    out = ""
+
+    # Scene range
+    if b is not None and d is not None:
+        scene_range = b - d
+        out += f"Scene brightness range: {scene_range:.2f} stops\n"
+
+    # Zone placement suggestion
+    if mode == _MODE_SHADOWS:
+        out += f"Place shadows on Zone III → Suggested EV: {suggested_ev:.2f}\n"
+        if b is not None:
+            # Zone V + (b - (d + 2)) simplifies to 3 + b - d
+            out += f"Highlights would fall at Zone {3.0 + b - d:.1f}\n"
+    elif mode == _MODE_SUBJECT:
+        out += f"Place subject on Zone V → Suggested EV: {suggested_ev:.2f}\n"
+    elif mode == _MODE_MIDTONE:
+        out += f"Use midtone reading (Zone V) → Suggested EV: {suggested_ev:.2f}\n"
+    else:
+        out += f"Fallback: using first reading → Suggested EV: {suggested_ev:.2f}\n"
+
+    # Convert EV back to shutter speed
+    shutter_speed = ev_to_shutter(adjusted_ev)
+    if shutter_speed >= 1:
+        shutter_str = f"{shutter_speed:.0f}s"
+    else:
+        shutter_str = f"1/{round(1/shutter_speed):.0f}s"
+
+    return out + f"Suggested exposure ≈ {shutter_str} at f/{aperture} ISO {iso}"
+
+# --- Static Content ---
+_PAGE_CONFIG = {"page_title": "Zone System Calculator", "layout": "centered"}
+
+_CSS = """
+    <style>
+    .stButton>button, .stFormSubmitButton>button {
+        border-radius: 12px;
+        padding: 10px 20px;
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+    }
+    .stButton>button:hover, .stFormSubmitButton>button:hover {
+        background-color: #45a049;
+    }
+    .result-box {
+        background-color: #f8f9fa;
+        border-radius: 15px;
+        padding: 20px;
+        margin-top: 20px;
+        box-shadow: 0px 4px 6px rgba(0,0,0,0.1);
+        font-size: 16px;
+    }
+    </style>
+"""
+
+_DEPLOYMENT_MD = """
+## 🚀 Deployment Instructions
+1. Save `zone_system_app.py` and `zone_core.py` in the same folder.
+2. Create a file called `requirements.txt` in the same folder with the following line:
+   ```
+   streamlit
+   ```
+3. Push all three files to a GitHub repository.
+4. Go to [Streamlit Community Cloud](https://share.streamlit.io), sign in, and deploy your repo.
+5. Your app will get a public URL you can share.
+"""
+
+@st.cache_resource
+def _css_blob():
+    return _CSS
+
+def configure_page():
+    # Runs every rerun: Streamlit only keeps the page config and CSS element
+    # emitted by the current run, so this must not be skipped once cached
+    st.set_page_config(**_PAGE_CONFIG)
+    st.markdown(_css_blob(), unsafe_allow_html=True)
+
+def render_deployment_section():
+    st.markdown(_DEPLOYMENT_MD)